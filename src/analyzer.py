@@ -1,14 +1,19 @@
 from __future__ import annotations
 
-from typing import Dict, List, Tuple
+from typing import TYPE_CHECKING, Dict, List, NamedTuple, Tuple
 
+import hashlib
 import json
+import os
+import threading
+from functools import lru_cache
 from pathlib import Path
 
 import emoji
 import numpy as np
-from sentence_transformers import SentenceTransformer
-from transformers import pipeline
+
+if TYPE_CHECKING:
+    from sentence_transformers import SentenceTransformer
 
 import re
 
@@ -21,34 +26,141 @@ LONG_PATH = BASE_DIR / "sample_data" / "long_entries.json"
 POETIC_PATH = BASE_DIR / "sample_data" / "poetic_entries.json"
 JOURNAL_PATH = BASE_DIR / "sample_data" / "journal_samples.json"
 JOURNAL100_PATH = BASE_DIR / "sample_data" / "journal_samples_100.json"
+CACHE_DIR = BASE_DIR / ".cache"
+
+
+
+# --- Runtime options ---------------------------------------------------------
+
+
+def _env_flag(name: str) -> bool:
+    """True if the environment variable is set to a truthy value."""
+    return os.environ.get(name, "").strip().lower() in {"1", "true", "yes", "on"}
+
+
+def _env_int(name: str) -> int:
+    """Positive integer from the environment, or 0 if unset/invalid."""
+    try:
+        return max(0, int(os.environ.get(name, "")))
+    except ValueError:
+        return 0
+
 
+# Opt-in: run the encoder's Linear layers as int8 (dynamic quantization).
+# Faster on CPU (VNNI), at the cost of slightly perturbed embeddings.
+QUANTIZE = _env_flag("ANALYZER_QUANTIZE")
+
+# "torch" (default) or "onnx": run the encoder through ONNX Runtime using the
+# graph-optimized / int8 exports published with the model.
+BACKEND = os.environ.get("ANALYZER_BACKEND", "torch").strip().lower()
+
+# Intra-op threads for torch on CPU. Unset keeps torch's default (one per
+# core); set it to cores / uvicorn workers so workers don't over-subscribe.
+TORCH_THREADS = _env_int("ANALYZER_TORCH_THREADS")
 
 
 # --- Embedding model ---------------------------------------------------------
 
-_embedder = SentenceTransformer("all-MiniLM-L6-v2")
+MODEL_NAME = "all-MiniLM-L6-v2"
+
+# torch / sentence-transformers are imported and the model is loaded on first
+# use, so importing this module (or analyzing trivially-Unknown input) is cheap.
+
+
+@lru_cache(maxsize=None)
+def _precision() -> str:
+    """
+    Use the GPU in half precision when one is available; CPU stays FP32
+    (or int8 with ANALYZER_QUANTIZE, which is a CPU-only technique).
+    """
+    import torch
+
+    if BACKEND != "onnx" and torch.cuda.is_available():
+        return "fp16"
+    return "int8" if QUANTIZE else "fp32"
+
+
+_embedder: SentenceTransformer | None = None
+_embedder_lock = threading.Lock()
+
+
+def _get_embedder() -> SentenceTransformer:
+    """
+    Return the sentence encoder, loading it on first use.
+    Guarded by a lock so concurrent first requests load the model only once.
+    """
+    global _embedder
+    if _embedder is None:
+        with _embedder_lock:
+            if _embedder is None:
+                _embedder = _load_embedder()
+    return _embedder
+
+
+def _load_embedder() -> SentenceTransformer:
+    """Construct the encoder for the configured backend and precision."""
+    import torch
+    from sentence_transformers import SentenceTransformer
+
+    precision = _precision()
+
+    if TORCH_THREADS:
+        torch.set_num_threads(TORCH_THREADS)
+        try:
+            # Only allowed before any inter-op parallel work has started
+            torch.set_num_interop_threads(1)
+        except RuntimeError:
+            pass
+
+    if BACKEND == "onnx":
+        # Needs onnxruntime (pip install "sentence-transformers[onnx]")
+        file_name = "onnx/model_quint8_avx2.onnx" if precision == "int8" else "onnx/model_O3.onnx"
+        return SentenceTransformer(
+            MODEL_NAME, device="cpu", backend="onnx", model_kwargs={"file_name": file_name}
+        )
+
+    embedder = SentenceTransformer(MODEL_NAME, device="cuda" if precision == "fp16" else "cpu")
+
+    if precision == "fp16":
+        embedder.half()
+    elif precision == "int8":
+        embedder[0].auto_model = torch.ao.quantization.quantize_dynamic(
+            embedder[0].auto_model, {torch.nn.Linear}, dtype=torch.qint8
+        )
+    return embedder
 
 
 def _embed(text: str) -> np.ndarray:
-    """Return a normalized sentence embedding."""
-    v = _embedder.encode(text, convert_to_numpy=True)
-    # Normalize for cosine similarity via dot product
-    norm = np.linalg.norm(v)
-    if norm == 0.0:
-        return v
-    return v / norm
+    """
+    Return a normalized sentence embedding.
+    Not cached itself: its only caller, _analyze_cleaned, is memoized.
+    """
+    # Normalized inside encode() so cosine similarity is a plain dot product
+    return _get_embedder().encode(
+        text, convert_to_numpy=True, normalize_embeddings=True
+    ).astype(np.float32, copy=False)
 
 # --- Emoji helper ------------------------------------------------------------
 
 
+# Single-codepoint emojis. Per-character membership here is equivalent to
+# emoji.is_emoji(ch) but avoids a Python-level call for every character.
+_EMOJI_CHARS = frozenset(e for e in emoji.EMOJI_DATA if len(e) == 1)
+
+
 def _extract_emojis(text: str) -> List[str]:
-    return [ch for ch in text if emoji.is_emoji(ch)]
+    return [ch for ch in text if ch in _EMOJI_CHARS]
+
+
+# Emojis that pull an emoji-only entry toward negative / positive mood
+NEGISH = frozenset({"😭", "😢", "😔", "😩", "😫", "😡", "💀", "🥲"})
+POSISH = frozenset({"😄", "😁", "😆", "😎", "😊", "😂", "🤩", "❤️", "✨", "👍"})
 
 
 # --- Prototype definitions ---------------------------------------------------
 
-MOOD_CLASS_LABELS = ["Positive", "Negative", "Neutral", "Mixed", "Confused"]
-ENERGY_CLASS_LABELS = ["High Energy", "Low Energy", "High Stress", "Calm"]
+MOOD_CLASS_LABELS = ("Positive", "Negative", "Neutral", "Mixed", "Confused")
+ENERGY_CLASS_LABELS = ("High Energy", "Low Energy", "High Stress", "Calm")
 
 # Seed prototypes (generic, not tied to specific slang)
 MOOD_PROTOTYPES = {
@@ -199,6 +311,17 @@ _MID_IDIOMS = [
 ]
 
 
+def _compile_idioms(patterns: List[str]) -> re.Pattern[str]:
+    """Fold a list of idiom patterns into one case-insensitive alternation."""
+    return re.compile("|".join(f"(?:{p})" for p in patterns), re.IGNORECASE)
+
+
+# One precompiled scan per idiom group instead of a re.search per pattern
+_POSITIVE_IDIOMS_RE = _compile_idioms(_POSITIVE_IDIOMS)
+_NEGATIVE_IDIOMS_RE = _compile_idioms(_NEGATIVE_IDIOMS)
+_MID_IDIOMS_RE = _compile_idioms(_MID_IDIOMS)
+
+
 def _calibrate_for_idioms(text: str, mood: str, energy: str) -> tuple[str, str]:
     """
     Adjust mood/energy for strongly idiomatic phrases
@@ -206,53 +329,54 @@ def _calibrate_for_idioms(text: str, mood: str, energy: str) -> tuple[str, str]:
     This is a narrow, high-impact correction layer on top
     of the embedding+centroid classifier.
     """
-    lower = text.lower()
-
     # Positive performance idioms: "crushing it", "killing it", etc.
-    for pattern in _POSITIVE_IDIOMS:
-        if re.search(pattern, lower):
-            # If the model thought this was Negative/Confused, pull it up
-            if mood in {"Negative", "Confused"}:
-                mood = "Positive"
-            elif mood == "Mixed":
-                # still allow Mixed but lean positive in feel
-                mood = "Mixed"
-            # These phrases are almost always high-energy hype
-            if energy in {"Calm", "Low Energy", "Unknown"}:
-                energy = "High Energy"
-            return mood, energy
+    if _POSITIVE_IDIOMS_RE.search(text):
+        # If the model thought this was Negative/Confused, pull it up
+        if mood in {"Negative", "Confused"}:
+            mood = "Positive"
+        elif mood == "Mixed":
+            # still allow Mixed but lean positive in feel
+            mood = "Mixed"
+        # These phrases are almost always high-energy hype
+        if energy in {"Calm", "Low Energy", "Unknown"}:
+            energy = "High Energy"
+        return mood, energy
 
     # Negative strain idioms: "it's killing me", "it's crushing me"
-    for pattern in _NEGATIVE_IDIOMS:
-        if re.search(pattern, lower):
-            if mood in {"Positive", "Neutral"}:
-                mood = "Negative"
-            elif mood == "Mixed":
-                mood = "Mixed"  # keep mixed but clearly not positive
-            # These usually feel like high stress / strain
-            if energy in {"Calm", "Low Energy", "Unknown"}:
-                energy = "High Stress"
-            return mood, energy
+    if _NEGATIVE_IDIOMS_RE.search(text):
+        if mood in {"Positive", "Neutral"}:
+            mood = "Negative"
+        elif mood == "Mixed":
+            mood = "Mixed"  # keep mixed but clearly not positive
+        # These usually feel like high stress / strain
+        if energy in {"Calm", "Low Energy", "Unknown"}:
+            energy = "High Stress"
+        return mood, energy
 
     # "Mid" / meh idioms: push toward Neutral/Mixed and avoid extremes
-    for pattern in _MID_IDIOMS:
-        if re.search(pattern, lower):
-            if mood in {"Positive", "Negative"}:
-                mood = "Mixed"  # often feels like muted / in-between
-            if energy == "High Stress":
-                energy = "Low Energy"  # aggressively mid = low vibe, not panic
-            return mood, energy
+    if _MID_IDIOMS_RE.search(text):
+        if mood in {"Positive", "Negative"}:
+            mood = "Mixed"  # often feels like muted / in-between
+        if energy == "High Stress":
+            energy = "Low Energy"  # aggressively mid = low vibe, not panic
+        return mood, energy
 
     return mood, energy
 
 
+# Labeled replies of at most two words → (mood, energy); looked up before
+# embedding so trivial short entries never hit the model
+SHORT_RESPONSES: Dict[str, Tuple[str, str]] = {}
+
+
 def _augment_prototypes_from_labeled(path: Path) -> None:
     """
     Given a labeled JSON file with fields:
       - text
       - expected_mood
       - expected_energy
-    use it to expand the prototype sets for mood and energy.
+    use it to expand the prototype sets for mood and energy,
+    and record very short replies in SHORT_RESPONSES.
     """
     if not path.exists():
         return
@@ -276,33 +400,239 @@ def _augment_prototypes_from_labeled(path: Path) -> None:
         if energy in ENERGY_CLASS_LABELS:
             ENERGY_PROTOTYPES.setdefault(energy, []).append(text)
 
+        if (
+            len(text.split()) <= 2
+            and mood in MOOD_CLASS_LABELS
+            and energy in ENERGY_CLASS_LABELS
+        ):
+            SHORT_RESPONSES[text.lower()] = (mood, energy)
+
 
 # Use ALL labeled datasets to shape the centroids:
 for p in (AMBIG_PATH, LONG_PATH, POETIC_PATH, JOURNAL_PATH, JOURNAL100_PATH):
     _augment_prototypes_from_labeled(p)
 
 
-def _compute_centroids(prototypes: Dict[str, List[str]]) -> Dict[str, np.ndarray]:
+# Prototype sentences embedded per encode() call when building centroids
+_CENTROID_CHUNK = 512
+
+
+def _compute_centroids(*prototype_sets: Dict[str, List[str]]) -> List[Dict[str, np.ndarray]]:
     """
     Compute an embedding centroid for each class label from its prototype sentences.
+
+    All prototype sets (e.g. mood and energy) are embedded together so the
+    encoder sees one stream of full batches; one centroid dict is returned per set.
     """
-    centroids: Dict[str, np.ndarray] = {}
-    for label, sentences in prototypes.items():
-        if not sentences:
-            continue
-        vecs = np.stack([_embed(s) for s in sentences], axis=0)
-        centroids[label] = vecs.mean(axis=0)
-        # Normalize centroids as well
-        norm = np.linalg.norm(centroids[label])
-        if norm != 0.0:
-            centroids[label] = centroids[label] / norm
-    return centroids
+    groups = [
+        (k, label)
+        for k, prototypes in enumerate(prototype_sets)
+        for label, sentences in prototypes.items()
+        if sentences
+    ]
+    results: List[Dict[str, np.ndarray]] = [{} for _ in prototype_sets]
+    if not groups:
+        return results
+
+    # Encode prototypes in large batched chunks and fold each chunk into
+    # per-label running sums, so memory stays O(K·D) however big the corpus grows
+    flat = [s for k, label in groups for s in prototype_sets[k][label]]
+    counts = np.array([len(prototype_sets[k][label]) for k, label in groups])
+    label_of_row = np.repeat(np.arange(len(groups)), counts)
+
+    embedder = _get_embedder()
+    sums = np.zeros((len(groups), embedder.get_sentence_embedding_dimension()), dtype=np.float32)
+    for start in range(0, len(flat), _CENTROID_CHUNK):
+        vecs = embedder.encode(
+            flat[start:start + _CENTROID_CHUNK],
+            batch_size=64,
+            convert_to_numpy=True,
+            normalize_embeddings=True,
+            show_progress_bar=False,
+        ).astype(np.float32, copy=False)
+        np.add.at(sums, label_of_row[start:start + _CENTROID_CHUNK], vecs)
+
+    means = sums / counts[:, None].astype(np.float32)
+
+    # Normalize centroids as well
+    norms = np.linalg.norm(means, axis=1, keepdims=True)
+    means = np.divide(means, norms, out=means, where=norms != 0.0)
+
+    for i, (k, label) in enumerate(groups):
+        results[k][label] = means[i]
+    return results
+
+
+def _prototype_hash(prototypes: Dict[str, List[str]]) -> str:
+    """Fingerprint the prototype set together with the model configuration."""
+    h = hashlib.blake2b(digest_size=16)
+    h.update(MODEL_NAME.encode("utf-8"))
+    h.update(BACKEND.encode("utf-8"))
+    h.update(_precision().encode("utf-8"))
+    h.update(json.dumps(sorted(prototypes.items()), ensure_ascii=False).encode("utf-8"))
+    return h.hexdigest()
+
+
+def _centroid_cache_path(prototypes: Dict[str, List[str]]) -> Path:
+    return CACHE_DIR / f"centroids_{_prototype_hash(prototypes)}.npz"
+
+
+def _read_centroid_cache(path: Path) -> Dict[str, np.ndarray] | None:
+    if not path.exists():
+        return None
+    try:
+        with np.load(path) as data:
+            return {label: data[label].astype(np.float32, copy=False) for label in data.files}
+    except Exception:
+        # Corrupted / partial cache file: rebuild
+        return None
+
+
+def _write_centroid_cache(path: Path, centroids: Dict[str, np.ndarray]) -> None:
+    # Write to a temp file and rename so concurrent imports never see a partial file
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        with open(tmp, "wb") as f:
+            np.savez(f, **centroids)
+        os.replace(tmp, path)
+    except OSError:
+        pass
+
+
+def _load_or_compute_centroids(
+    *prototype_sets: Dict[str, List[str]]
+) -> List[Dict[str, np.ndarray]]:
+    """
+    Load centroids from the on-disk cache for every prototype set that is
+    unchanged; compute the rest in a single batched pass and write their
+    caches for the next process.
+    """
+    paths = [_centroid_cache_path(p) for p in prototype_sets]
+    results = [_read_centroid_cache(path) for path in paths]
+
+    missing = [k for k, r in enumerate(results) if r is None]
+    if missing:
+        computed = _compute_centroids(*(prototype_sets[k] for k in missing))
+        for k, centroids in zip(missing, computed):
+            _write_centroid_cache(paths[k], centroids)
+            results[k] = centroids
+
+    return results
+
+
+def _stack_centroids(
+    centroids: Dict[str, np.ndarray], class_labels: Tuple[str, ...]
+) -> Tuple[Tuple[str, ...], np.ndarray]:
+    """
+    Stack the centroids of the labels that have one into a (K, D) matrix,
+    so all class similarities come out of a single matmul.
+    """
+    labels = tuple(label for label in class_labels if label in centroids)
+    if not labels:
+        dim = _get_embedder().get_sentence_embedding_dimension()
+        return labels, np.empty((0, dim), dtype=np.float32)
+    matrix = np.stack([centroids[label] for label in labels]).astype(np.float32, copy=False)
+    return labels, matrix
+
+
+def _quantize_int8(x: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Symmetric per-row int8 quantization along the last axis.
+    Returns (q, scale) with x ≈ q / scale, scale shaped (..., 1).
+    """
+    peak = np.max(np.abs(x), axis=-1, keepdims=True)
+    scale = np.where(peak > 0.0, 127.0 / np.maximum(peak, 1e-12), 1.0).astype(np.float32)
+    return np.round(x * scale).astype(np.int8), scale
+
+
+class _CentroidIndex(NamedTuple):
+    mood_labels: Tuple[str, ...]
+    energy_labels: Tuple[str, ...]
+    # Mood rows followed by energy rows: both label groups are scored in one pass
+    matrix: np.ndarray
+    # int8 copy (+ per-row scales) used for scoring when ANALYZER_QUANTIZE is set
+    matrix_i8: np.ndarray
+    matrix_scale: np.ndarray
+
+
+_centroid_index: _CentroidIndex | None = None
+_centroid_index_lock = threading.Lock()
 
 
-MOOD_CENTROIDS = _compute_centroids(MOOD_PROTOTYPES)
-ENERGY_CENTROIDS = _compute_centroids(ENERGY_PROTOTYPES)
+def _get_centroid_index() -> _CentroidIndex:
+    """Load (or compute) the mood and energy centroids on first use."""
+    global _centroid_index
+    if _centroid_index is None:
+        with _centroid_index_lock:
+            if _centroid_index is None:
+                _centroid_index = _build_centroid_index()
+    return _centroid_index
 
-def _classify_mood_with_top2(vec: np.ndarray, text: str) -> str:
+
+def _build_centroid_index() -> _CentroidIndex:
+    mood_centroids, energy_centroids = _load_or_compute_centroids(
+        MOOD_PROTOTYPES, ENERGY_PROTOTYPES
+    )
+    mood_labels, mood_matrix = _stack_centroids(mood_centroids, MOOD_CLASS_LABELS)
+    energy_labels, energy_matrix = _stack_centroids(energy_centroids, ENERGY_CLASS_LABELS)
+    matrix = np.vstack([mood_matrix, energy_matrix])
+    matrix_i8, matrix_scale = _quantize_int8(matrix)
+    return _CentroidIndex(mood_labels, energy_labels, matrix, matrix_i8, matrix_scale[:, 0])
+
+
+def load_centroids() -> None:
+    """
+    Load the mood/energy centroids now (from the .cache/ files, or by
+    embedding the prototypes and writing them) rather than on first analysis.
+    """
+    _get_centroid_index()
+
+
+def warm_up() -> None:
+    """
+    Load the encoder and centroids and run one forward pass, so the first
+    real request doesn't pay for model loading or lazy kernel setup.
+    """
+    load_centroids()
+    _get_embedder().encode(
+        "Today was a normal day.", convert_to_numpy=True, normalize_embeddings=True
+    )
+
+
+def _centroid_scores(vecs: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Cosine similarity of one (D,) or many (N, D) embeddings against every
+    mood and energy centroid, computed in one matmul and split back into
+    (mood_scores, energy_scores) along the last axis.
+    In quantized mode the dot products accumulate in int32 and are rescaled.
+    """
+    index = _get_centroid_index()
+    if _precision() == "int8":
+        vecs_i8, vecs_scale = _quantize_int8(vecs)
+        acc = vecs_i8.astype(np.int32) @ index.matrix_i8.astype(np.int32).T
+        scores = acc.astype(np.float32) / (vecs_scale * index.matrix_scale)
+    else:
+        scores = vecs.astype(np.float32, copy=False) @ index.matrix.T
+    n_mood = len(index.mood_labels)
+    return scores[..., :n_mood], scores[..., n_mood:]
+
+
+# Whole-word cues used to keep short, clearly positive statements out of Mixed
+POSITIVE_CUES = frozenset({"great", "good", "amazing", "fantastic", "awesome", "happy", "excellent"})
+NEGATIVE_CUES = frozenset({"bad", "terrible", "awful", "sad", "scared", "anxious", "stressed"})
+_WORD_RE = re.compile(r"[a-z]+")
+
+
+def _top2(scores: np.ndarray) -> np.ndarray:
+    """Indices of the (up to) two highest scores, best first."""
+    if len(scores) <= 2:
+        return np.argsort(-scores, kind="stable")
+    idx = np.argpartition(-scores, 1)[:2]
+    return idx[np.argsort(-scores[idx], kind="stable")]
+
+
+def _classify_mood_with_top2(scores: np.ndarray, text: str) -> str:
     """
     Classify mood using centroid similarity,
     but allow 'Mixed' only when Positive & Negative are both strong.
@@ -313,25 +643,19 @@ def _classify_mood_with_top2(vec: np.ndarray, text: str) -> str:
     - "I feel great" → now properly returns Positive
     """
 
-    scores: list[tuple[str, float]] = []
-
-    for label in MOOD_CLASS_LABELS:
-        centroid = MOOD_CENTROIDS.get(label)
-        if centroid is None:
-            continue
-        score = float(np.dot(vec, centroid))
-        scores.append((label, score))
-
-    if not scores:
+    labels = _get_centroid_index().mood_labels
+    if not labels:
         return "Unknown"
 
-    # sort best to worst
-    scores.sort(key=lambda x: x[1], reverse=True)
-    best_label, best_score = scores[0]
+    # best and runner-up
+    order = _top2(scores)
+    best_label = labels[order[0]]
+    best_score = scores[order[0]]
 
     # if we have at least 2 for Mixed detection
-    if len(scores) > 1:
-        second_label, second_score = scores[1]
+    if len(order) > 1:
+        second_label = labels[order[1]]
+        second_score = scores[order[1]]
 
         # Mixed candidate ONLY when Positive + Negative are top competitors
         if {best_label, second_label} == {"Positive", "Negative"}:
@@ -340,16 +664,10 @@ def _classify_mood_with_top2(vec: np.ndarray, text: str) -> str:
             if best_score > 0.40 and second_score > 0.40:
 
                 # detect simple short positive statements (fixes "I feel great")
-                lower = text.lower()
+                words = frozenset(_WORD_RE.findall(text.lower()))
                 word_count = len(text.split())
-                positive_cues = any(
-                    kw in lower for kw in
-                    ["great", "good", "amazing", "fantastic", "awesome", "happy", "excellent"]
-                )
-                negative_cues = any(
-                    kw in lower for kw in
-                    ["bad", "terrible", "awful", "sad", "scared", "anxious", "stressed"]
-                )
+                positive_cues = not POSITIVE_CUES.isdisjoint(words)
+                negative_cues = not NEGATIVE_CUES.isdisjoint(words)
 
                 # If text is clearly positive, do NOT force Mixed
                 if (
@@ -367,29 +685,23 @@ def _classify_mood_with_top2(vec: np.ndarray, text: str) -> str:
     return best_label
 
 
-def _classify_energy_with_top2(vec: np.ndarray, mood: str) -> str:
+def _classify_energy_with_top2(scores: np.ndarray, mood: str) -> str:
     """
     Classify energy using centroid similarities, but resolve ambiguity
     between High Energy and High Stress using mood + closeness.
     """
-    scores: list[tuple[str, float]] = []
-
-    for label in ENERGY_CLASS_LABELS:
-        centroid = ENERGY_CENTROIDS.get(label)
-        if centroid is None:
-            continue
-        score = float(np.dot(vec, centroid))
-        scores.append((label, score))
-
-    if not scores:
+    labels = _get_centroid_index().energy_labels
+    if not labels:
         return "Unknown"
 
-    scores.sort(key=lambda x: x[1], reverse=True)
-    best_label, best_score = scores[0]
+    order = _top2(scores)
+    best_label = labels[order[0]]
+    best_score = scores[order[0]]
 
     # If we have at least two labels, inspect the runner-up
-    if len(scores) > 1:
-        second_label, second_score = scores[1]
+    if len(order) > 1:
+        second_label = labels[order[1]]
+        second_score = scores[order[1]]
 
         # Special handling when the model is torn between "High Energy"
         # and "High Stress": use mood to steer.
@@ -403,9 +715,80 @@ def _classify_energy_with_top2(vec: np.ndarray, mood: str) -> str:
     return best_label
 
 
+# --- Rule layer --------------------------------------------------------------
+
+
+def _is_trivially_unknown(cleaned: str) -> bool:
+    """
+    Empty, numbers-only, or single gibberish-looking tokens are tagged
+    Unknown without running the model.
+    """
+    if not cleaned:
+        return True
+
+    # Treat pure digits / gibberish-y single tokens as Unknown
+    no_space = "".join(cleaned.split())
+
+    # Numbers-only → Unknown
+    if no_space.isdigit():
+        return True
+
+    # Single long token with letters, no spaces, no emojis → likely gibberish / handle as Unknown
+    # (whitespace and emoji are not alpha, so one isalpha() covers all three)
+    if len(cleaned) >= 5 and cleaned.isalpha():
+        return True
+
+    return False
+
+
+def _has_only_emoji(cleaned: str, ems: List[str]) -> bool:
+    """
+    True if the entry has emojis and nothing but emojis and spaces.
+    Stops at the first other character, so ordinary text exits almost
+    immediately, and no space-stripped copy of the string is built.
+    """
+    # Only " " is skipped (not tabs/newlines), as the original length check did
+    return bool(ems) and all(ch in _EMOJI_CHARS or ch == " " for ch in cleaned)
+
+
+def _adjust_for_surface_cues(
+    cleaned: str, ems: List[str], mood: str, energy: str
+) -> Tuple[str, str]:
+    """Emoji / short-text adjustments followed by idiom calibration."""
+    # Generic emoji / short-text adjustments (no phrase-specific rules)
+    if _has_only_emoji(cleaned, ems):
+        neg_hit = not NEGISH.isdisjoint(ems)
+        pos_hit = not POSISH.isdisjoint(ems)
+
+        if neg_hit and mood in {"Positive", "Neutral"}:
+            mood = "Negative"
+        elif pos_hit and mood in {"Negative", "Neutral"}:
+            mood = "Positive"
+
+        if neg_hit and energy in {"Calm", "Low Energy", "Unknown"}:
+            energy = "High Stress"
+
+    # very short flat responses without emojis: often low energy / low affect
+    if len(cleaned.split()) <= 2 and not ems and mood in {"Neutral", "Unknown"}:
+        energy = "Low Energy"
+
+    # Idiom-based calibration (targeted phrase adjustments)
+    return _calibrate_for_idioms(cleaned, mood, energy)
+
+
 # --- Core API ----------------------------------------------------------------
 
 
+class Analysis(NamedTuple):
+    """Mood and energy tags for one journal entry."""
+
+    mood: str
+    energy: str
+
+
+_UNKNOWN = Analysis("Unknown", "Unknown")
+
+
 def analyze_text(text: str) -> Dict[str, str]:
     """
     Analyze a journal entry and return tags:
@@ -420,58 +803,91 @@ def analyze_text(text: str) -> Dict[str, str]:
     """
     if text is None:
         text = ""
-    cleaned = text.strip()
+    return _analyze_cleaned(text.strip())._asdict()
 
-    # 1) Handle empty / whitespace-only safely
-    if not cleaned:
-        return {"mood": "Unknown", "energy": "Unknown"}
-    # Treat pure digits / gibberish-y single tokens as Unknown
-    no_space = "".join(cleaned.split())
 
-    # Numbers-only → Unknown
-    if no_space.isdigit():
-        return {"mood": "Unknown", "energy": "Unknown"}
-
-    # Single long token with letters, no spaces, no emojis → likely gibberish / handle as Unknown
-    if (
-        len(cleaned.split()) == 1
-        and len(no_space) >= 5
-        and no_space.isalpha()
-        and not _extract_emojis(cleaned)
-    ):
-        return {"mood": "Unknown", "energy": "Unknown"}
-
-
-    # 2) Embed the text
-    vec = _embed(cleaned)
+@lru_cache(maxsize=4096)
+def _analyze_cleaned(cleaned: str) -> Analysis:
+    """
+    Tags for already-stripped text.
 
-    # 3) Classify via centroids with top-2 logic
-    mood = _classify_mood_with_top2(vec, cleaned)
-    energy = _classify_energy_with_top2(vec, mood)
+    Memoized: the result depends only on the text and on centroids that are
+    fixed once built, so repeated entries skip the model entirely.
+    """
+    # 1) Handle empty / numeric / gibberish input before any model work
+    if _is_trivially_unknown(cleaned):
+        return _UNKNOWN
 
+    ems = _extract_emojis(cleaned)
 
-    # 4) Generic emoji / short-text adjustments (no phrase-specific rules)
+    # 2) Known short reply → skip the model entirely
+    short = SHORT_RESPONSES.get(cleaned.lower())
+    if short is not None:
+        mood, energy = short
+    else:
+        # 3) Embed the text and classify via centroids with top-2 logic
+        vec = _embed(cleaned)
+        mood_scores, energy_scores = _centroid_scores(vec)
+        mood = _classify_mood_with_top2(mood_scores, cleaned)
+        energy = _classify_energy_with_top2(energy_scores, mood)
 
-    ems = _extract_emojis(cleaned)
-    has_only_emoji = bool(ems) and len(cleaned.replace(" ", "")) == len(ems)
+    # 4) Emoji / short-text adjustments and idiom calibration
+    return Analysis(*_adjust_for_surface_cues(cleaned, ems, mood, energy))
 
-    if has_only_emoji:
-        negish = {"😭", "😢", "😔", "😩", "😫", "😡", "💀", "🥲"}
-        posish = {"😄", "😁", "😆", "😎", "😊", "😂", "🤩", "❤️", "✨", "👍"}
 
-        if any(e in negish for e in ems) and mood in {"Positive", "Neutral"}:
-            mood = "Negative"
-        elif any(e in posish for e in ems) and mood in {"Negative", "Neutral"}:
-            mood = "Positive"
+def analyze_batch(texts: List[str]) -> List[Dict[str, str]]:
+    """
+    Analyze many journal entries at once.
+
+    Tags follow the same rules as analyze_text, but every text that needs
+    the model is embedded in one batched encode() call and scored against
+    all centroids with a single (N, D) @ (D, K) product. The result is
+    equivalent up to batching numerics: padded batches can shift embeddings
+    slightly, which may flip a borderline top-2 decision. The batch path
+    neither reads nor fills analyze_text's cache.
+    """
+    return [a._asdict() for a in analyze_texts(texts)]
 
-        if any(e in negish for e in ems) and energy in {"Calm", "Low Energy", "Unknown"}:
-            energy = "High Stress"
 
-    # very short flat responses without emojis: often low energy / low affect
-    if len(cleaned.split()) <= 2 and not ems and mood in {"Neutral", "Unknown"}:
-        energy = "Low Energy"
-    
-    # 5) Idiom-based calibration (targeted phrase adjustments)
-    mood, energy = _calibrate_for_idioms(cleaned, mood, energy)
+def analyze_texts(texts: List[str]) -> List[Analysis]:
+    """Same as analyze_batch, but returns Analysis tuples instead of dicts."""
+    cleaned = [(t or "").strip() for t in texts]
+    ems: List[List[str]] = [[] for _ in cleaned]
+    results = [_UNKNOWN] * len(cleaned)
 
-    return {"mood": mood, "energy": energy}
+    todo = []
+    for i, c in enumerate(cleaned):
+        if _is_trivially_unknown(c):
+            continue
+        ems[i] = _extract_emojis(c)
+        todo.append(i)
+
+    if not todo:
+        return results
+
+    # Embed each distinct text once, skipping known short replies
+    unique = list(dict.fromkeys(
+        cleaned[i] for i in todo if cleaned[i].lower() not in SHORT_RESPONSES
+    ))
+    row_of = {t: r for r, t in enumerate(unique)}
+    if unique:
+        vecs = _get_embedder().encode(
+            unique,
+            batch_size=64,
+            convert_to_numpy=True,
+            normalize_embeddings=True,
+            show_progress_bar=False,
+        ).astype(np.float32, copy=False)
+        mood_scores, energy_scores = _centroid_scores(vecs)
+
+    for i in todo:
+        short = SHORT_RESPONSES.get(cleaned[i].lower())
+        if short is not None:
+            mood, energy = short
+        else:
+            r = row_of[cleaned[i]]
+            mood = _classify_mood_with_top2(mood_scores[r], cleaned[i])
+            energy = _classify_energy_with_top2(energy_scores[r], mood)
+        results[i] = Analysis(*_adjust_for_surface_cues(cleaned[i], ems[i], mood, energy))
+
+    return results
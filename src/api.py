@@ -1,15 +1,34 @@
 from __future__ import annotations
 
+from contextlib import asynccontextmanager
 from datetime import datetime
-from typing import List
+from typing import AsyncIterator, List
 
 from fastapi import FastAPI
+from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
 
-from .analyzer import analyze_text
+from .analyzer import analyze_text, warm_up
 from .storage import create_entry, get_last_entries
 
-app = FastAPI(title="AI Mood Journal API")
+
+@asynccontextmanager
+async def _lifespan(app: FastAPI) -> AsyncIterator[None]:
+    # Load the model + centroids once per worker, before serving requests
+    warm_up()
+    yield
+
+
+app = FastAPI(title="AI Mood Journal API", lifespan=_lifespan)
+
+# Enable CORS
+app.add_middleware(
+    CORSMiddleware,
+    allow_origins=["*"],  # In production, replace with specific origins
+    allow_credentials=True,
+    allow_methods=["*"],
+    allow_headers=["*"],
+)
 
 
 class EntryCreateRequest(BaseModel):
@@ -39,7 +58,7 @@ def create_journal_entry(payload: EntryCreateRequest) -> EntryResponse:
 
 
 @app.get("/entries", response_model=List[EntryResponse])
-def list_entries(limit: int = 20) -> List[EntryResponse]:
+def list_entries(limit: int = 50) -> List[EntryResponse]:
     entries = get_last_entries(limit)
     return [
         EntryResponse(
@@ -0,0 +1,48 @@
+"""
+Precompute the analyzer's centroid cache.
+
+    python -m src.build_centroids [--force]
+
+Embeds the mood and energy prototype corpora once and writes
+.cache/centroids_<hash>.npz. Later imports of the analyzer load those
+centroids instead of running the encoder over every prototype sentence.
+The hash covers the prototypes, model and precision, so a stale cache is
+never picked up; rerun this after editing sample_data/.
+"""
+
+from __future__ import annotations
+
+import argparse
+
+from .analyzer import (
+    ENERGY_PROTOTYPES,
+    MOOD_PROTOTYPES,
+    _centroid_cache_path,
+    _load_or_compute_centroids,
+)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Precompute analyzer centroids.")
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Recompute even if a cache file for the current prototypes exists.",
+    )
+    args = parser.parse_args()
+
+    names = ("mood", "energy")
+    prototype_sets = (MOOD_PROTOTYPES, ENERGY_PROTOTYPES)
+    paths = [_centroid_cache_path(p) for p in prototype_sets]
+
+    if args.force:
+        for path in paths:
+            path.unlink(missing_ok=True)
+
+    all_centroids = _load_or_compute_centroids(*prototype_sets)
+    for name, centroids, path in zip(names, all_centroids, paths):
+        print(f"{name}: {len(centroids)} centroids -> {path}")
+
+
+if __name__ == "__main__":
+    main()
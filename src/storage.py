@@ -1,51 +1,145 @@
 import json
+import os
+import threading
+from contextlib import contextmanager
 from datetime import datetime
+from itertools import islice
 from pathlib import Path
-from typing import List, Dict
+from typing import IO, Dict, Iterator, List
 
 from .models import JournalEntry
 
-# Path: repo_root/data/journal_entries.json
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+# Path: repo_root/data/journal_entries.jsonl (one JSON object per line)
 BASE_DIR = Path(__file__).resolve().parent.parent
 DATA_DIR = BASE_DIR / "data"
 DATA_DIR.mkdir(parents=True, exist_ok=True)
-ENTRIES_FILE = DATA_DIR / "journal_entries.json"
-
-
-def _load_raw() -> List[Dict]:
-    """Load raw JSON list from disk. If file missing/empty, return []."""
+ENTRIES_FILE = DATA_DIR / "journal_entries.jsonl"
+# Older versions stored a single pretty-printed JSON list here
+LEGACY_ENTRIES_FILE = DATA_DIR / "journal_entries.json"
+
+# Serializes migration, id allocation + appends within this process;
+# _file_lock does the same across processes (e.g. several uvicorn workers)
+_lock = threading.Lock()
+
+
+@contextmanager
+def _file_lock(f: IO) -> Iterator[None]:
+    """Hold an exclusive OS-level lock on an open file."""
+    if fcntl is not None:
+        fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+        return
+
+    # msvcrt locks a byte range from the current position; use byte 0
+    f.seek(0)
+    while True:
+        try:
+            msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+            break
+        except OSError:  # LK_LOCK gives up after ~10s; keep waiting
+            continue
+    try:
+        yield
+    finally:
+        f.seek(0)
+        msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+def _migrate_legacy() -> None:
+    """Convert a legacy JSON-list file to JSONL once, if no JSONL file exists yet."""
+    if ENTRIES_FILE.exists() or not LEGACY_ENTRIES_FILE.exists():
+        return
+
+    with _lock, LEGACY_ENTRIES_FILE.open("rb") as legacy, _file_lock(legacy):
+        # Another thread/process may have migrated while we waited
+        if ENTRIES_FILE.exists():
+            return
+
+        try:
+            text = legacy.read().decode("utf-8").strip()
+            raw_entries = json.loads(text) if text else []
+        except json.JSONDecodeError:
+            # If file is corrupted, you might log this; for now, start fresh
+            raw_entries = []
+
+        # New ids are derived from the last line, so write in id order
+        raw_entries = sorted(
+            (item for item in raw_entries if isinstance(item, dict)),
+            key=lambda item: int(item.get("id", 0)),
+        )
+
+        tmp = ENTRIES_FILE.with_name(f"{ENTRIES_FILE.name}.{os.getpid()}.tmp")
+        with tmp.open("w", encoding="utf-8") as f:
+            for item in raw_entries:
+                f.write(json.dumps(item, ensure_ascii=False) + "\n")
+        tmp.replace(ENTRIES_FILE)
+
+
+def _parse_lines(lines) -> Iterator[Dict]:
+    """Parse JSONL lines, skipping blank, corrupted or non-object ones."""
+    for line in lines:
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            item = json.loads(line)
+        except json.JSONDecodeError:
+            continue
+        if isinstance(item, dict):
+            yield item
+
+
+def _iter_raw() -> Iterator[Dict]:
+    """Yield raw entry dicts from disk in insertion order."""
+    _migrate_legacy()
     if not ENTRIES_FILE.exists():
-        return []
+        return
+    with ENTRIES_FILE.open("r", encoding="utf-8") as f:
+        yield from _parse_lines(f)
 
-    try:
-        text = ENTRIES_FILE.read_text(encoding="utf-8").strip()
-        if not text:
-            return []
-        return json.loads(text)
-    except json.JSONDecodeError:
-        # If file is corrupted, you might log this; for now, start fresh
-        return []
 
+def load_entries() -> List[JournalEntry]:
+    """Return all entries as JournalEntry objects."""
+    return [JournalEntry.from_dict(item) for item in _iter_raw()]
 
-def _save_raw(raw_entries: List[Dict]) -> None:
-    """Save raw list of dicts to disk as pretty JSON."""
-    ENTRIES_FILE.write_text(
-        json.dumps(raw_entries, indent=2, ensure_ascii=False),
-        encoding="utf-8",
-    )
 
+def _reversed_lines(f: IO[bytes], block_size: int = 4096) -> Iterator[bytes]:
+    """Yield the lines of a binary file last-to-first, reading backwards in blocks."""
+    pos = f.seek(0, os.SEEK_END)
+    partial = b""
+    while pos > 0:
+        step = min(block_size, pos)
+        pos -= step
+        f.seek(pos)
+        lines = (f.read(step) + partial).split(b"\n")
+        partial = lines.pop(0)  # may continue in the previous block
+        yield from reversed(lines)
+    yield partial
 
-def load_entries() -> List[JournalEntry]:
-    """Return all entries as JournalEntry objects."""
-    raw = _load_raw()
-    return [JournalEntry.from_dict(item) for item in raw]
 
+def _reversed_text_lines(f: IO[bytes]) -> Iterator[str]:
+    """_reversed_lines decoded; undecodable bytes end up as a corrupted (skipped) line."""
+    for line in _reversed_lines(f):
+        yield line.decode("utf-8", errors="replace")
 
-def _next_id(entries: List[JournalEntry]) -> int:
-    """Compute the next id as max(existing) + 1."""
-    if not entries:
-        return 1
-    return max(e.id for e in entries) + 1
+
+def _next_id(f: IO[bytes]) -> int:
+    """
+    Return the id after the last entry in the file (ids only grow, so this
+    is max + 1). Only the tail is read. Call with the file locked.
+    """
+    for item in _parse_lines(_reversed_text_lines(f)):
+        return int(item.get("id", 0)) + 1
+    return 1
 
 
 def create_entry(text: str, tags: Dict[str, str]) -> JournalEntry:
@@ -53,28 +147,43 @@ def create_entry(text: str, tags: Dict[str, str]) -> JournalEntry:
     Create a new JournalEntry with id + timestamp, persist it,
     and return the created entry.
     """
-    entries = load_entries()
-    new_id = _next_id(entries)
-    entry = JournalEntry(
-        id=new_id,
-        timestamp=datetime.now(),
-        text=text,
-        tags=tags,
-    )
-
-    # append and save
-    raw = [e.to_dict() for e in entries]
-    raw.append(entry.to_dict())
-    _save_raw(raw)
+    _migrate_legacy()
+    with _lock, ENTRIES_FILE.open("a+b") as f, _file_lock(f):
+        # The id is re-derived from disk under the lock, so writers in
+        # other processes never hand out the same one
+        entry = JournalEntry(
+            id=_next_id(f),
+            timestamp=datetime.now(),
+            text=text,
+            tags=tags,
+        )
+        line = json.dumps(entry.to_dict(), ensure_ascii=False) + "\n"
+        end = f.seek(0, os.SEEK_END)
+        if end:
+            # Don't glue onto a final line left without its newline (e.g. a crash)
+            f.seek(end - 1)
+            if f.read(1) != b"\n":
+                line = "\n" + line
+        f.write(line.encode("utf-8"))
+        f.flush()  # must hit the file before the lock is released
 
     return entry
 
 
 def get_last_entries(n: int = 3) -> List[JournalEntry]:
     """
-    Return the last n entries ordered by timestamp descending.
+    Return the last n entries, latest appended first.
+
+    Entries are appended in creation order, so this reads the file
+    backwards and only parses the final n entries.
     """
-    entries = load_entries()
-    # sort by timestamp (latest first)
-    entries.sort(key=lambda e: e.timestamp, reverse=True)
-    return entries[:n]
+    if n <= 0:
+        return []
+
+    _migrate_legacy()
+    if not ENTRIES_FILE.exists():
+        return []
+
+    with ENTRIES_FILE.open("rb") as f:
+        # latest first
+        return [JournalEntry.from_dict(item) for item in islice(_parse_lines(_reversed_text_lines(f)), n)]
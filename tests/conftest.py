@@ -0,0 +1,105 @@
+import logging
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+try:
+    from orjson import loads as _loads  # parses bytes directly, faster than stdlib json
+except ImportError:  # pragma: no cover
+    from json import loads as _loads
+
+from src.analyzer import analyze_texts, warm_up
+
+# Accuracy / mismatch reports; shown with `pytest --log-cli-level=DEBUG`
+logger = logging.getLogger("tests.sample_eval")
+
+SAMPLE_DIR = Path("sample_data")
+
+# Labeled sample sets scored by the accuracy tests
+SAMPLE_FILES = (
+    "journal_samples.json",
+    "journal_samples_100.json",
+    "long_entries.json",
+    "poetic_entries.json",
+)
+
+
+@pytest.fixture(scope="session")
+def warm_analyzer():
+    """
+    Load the encoder and centroids once per session. Requested by tests
+    (and fixtures) that run the model, so storage-only runs never load it.
+    """
+    warm_up()
+
+
+@pytest.fixture(scope="session")
+def samples():
+    """Every sample_data/*.json file, parsed once per session, keyed by file name."""
+    return {path.name: _loads(path.read_bytes()) for path in SAMPLE_DIR.glob("*.json")}
+
+
+@pytest.fixture(scope="session")
+def analyses(samples, warm_analyzer):
+    """
+    Analyzer output for every text in the sample files, keyed by text.
+    Built once per session with one batched call, so texts shared between
+    files (or tests) are only analyzed once.
+    """
+    texts = []
+    for name in SAMPLE_FILES:
+        texts.extend(row["text"] for row in samples[name])
+
+    unique = list(dict.fromkeys(texts))
+    return dict(zip(unique, analyze_texts(unique)))
+
+
+@pytest.fixture(scope="session")
+def sample_eval(samples, analyses):
+    """
+    Return run(name, label): score one sample file against its expected
+    mood/energy, log accuracy and mismatches, and return the mismatches.
+    """
+
+    def run(name, label):
+        data = samples[name]
+        mismatches = []
+
+        # Expected and predicted labels as parallel columns, built once
+        exp_moods = np.array([row["expected_mood"] for row in data])
+        exp_energies = np.array([row["expected_energy"] for row in data])
+        results = [analyses[row["text"]] for row in data]
+        pred_moods = np.array([r.mood for r in results])
+        pred_energies = np.array([r.energy for r in results])
+
+        # Compare whole columns at once; only mismatching rows are visited
+        mask = (pred_moods != exp_moods) | (pred_energies != exp_energies)
+        for i in np.flatnonzero(mask):
+            row = data[i]
+            mismatches.append({
+                "id": row["id"],
+                "expected": (row["expected_mood"], row["expected_energy"]),
+                "predicted": tuple(results[i]),
+                "text": row["text"],
+            })
+
+        total = len(data)
+        num_mismatch = len(mismatches)
+        accuracy = (total - num_mismatch) / total if total else 0.0
+
+        if logger.isEnabledFor(logging.DEBUG):
+            lines = [f"[{label}] Accuracy: {accuracy:.1%} "
+                     f"({total - num_mismatch}/{total} correct)"]
+            if mismatches:
+                lines.append(f"[{label}] Mismatches:")
+                for m in mismatches:
+                    lines.append(f"  id={m['id']}")
+                    lines.append(f"    expected : {m['expected']}")
+                    lines.append(f"    predicted: {m['predicted']}")
+                    lines.append(f"    text     : {m['text']}\n")
+            logger.debug("\n".join(lines))
+
+        return mismatches
+
+    return run
@@ -1,7 +1,82 @@
-from src.analyzer import analyze_text
+import numpy as np
+import pytest
 
-def test_analyze_text_returns_dict():
+from src import analyzer
+from src.analyzer import Analysis, analyze_batch, analyze_text, analyze_texts
+
+def test_analyze_text_returns_dict(warm_analyzer):
     result = analyze_text("I am crushing it at work!")
     assert isinstance(result, dict)
     assert "mood" in result
     assert "energy" in result
+
+def test_analyze_batch_matches_analyze_text(stub_model):
+    # Same model output on both paths, so the rule layers must agree exactly
+    stub_model("Neutral", "Calm")
+    texts = ["", "1234567890", "I am crushing it at work!", "😭😭😭", "meh", "I am crushing it at work!"]
+    assert analyze_batch(texts) == [analyze_text(t) for t in texts]
+
+def test_analyze_texts_returns_analysis_tuples(warm_analyzer):
+    texts = ["", "I am crushing it at work!"]
+    results = analyze_texts(texts)
+    assert all(isinstance(r, Analysis) for r in results)
+    assert [r._asdict() for r in results] == analyze_batch(texts)
+
+
+class _StubEncoder:
+    def encode(self, texts, **kwargs):
+        return np.zeros((len(texts), 1), dtype=np.float32)
+
+
+@pytest.fixture
+def stub_model(monkeypatch):
+    """
+    Replace the embedding + centroid step with fixed (mood, energy) output,
+    so the surface-cue rules applied on top of it can be checked exactly.
+    """
+    def use(mood, energy):
+        monkeypatch.setattr(analyzer, "_get_embedder", _StubEncoder)
+        monkeypatch.setattr(analyzer, "_embed", lambda text: np.zeros(1, dtype=np.float32))
+        monkeypatch.setattr(analyzer, "_centroid_scores", lambda vecs: (vecs, vecs))
+        monkeypatch.setattr(analyzer, "_classify_mood_with_top2", lambda scores, text: mood)
+        monkeypatch.setattr(analyzer, "_classify_energy_with_top2", lambda scores, m: energy)
+        monkeypatch.setattr(analyzer, "SHORT_RESPONSES", {})
+
+    analyzer._analyze_cleaned.cache_clear()
+    yield use
+    analyzer._analyze_cleaned.cache_clear()
+
+
+@pytest.mark.parametrize("text, model, expected", [
+    # Emoji-only: mood flips only away from the opposite pole / Neutral;
+    # positive emojis never touch energy, negative ones only raise flat energy
+    ("✨✨", ("Positive", "Calm"), ("Positive", "Calm")),
+    ("✨✨", ("Neutral", "Calm"), ("Positive", "Calm")),
+    ("👍", ("Mixed", "Low Energy"), ("Mixed", "Low Energy")),
+    ("😭😭", ("Mixed", "Calm"), ("Mixed", "High Stress")),
+    ("😭😭", ("Positive", "High Energy"), ("Negative", "High Energy")),
+    # Short replies and idioms adjust the model's answer rather than replace it
+    ("Ok.", ("Neutral", "Calm"), ("Neutral", "Low Energy")),
+    ("Fine.", ("Positive", "Calm"), ("Positive", "Calm")),
+    ("meh", ("Positive", "Calm"), ("Mixed", "Calm")),
+    ("killing it", ("Neutral", "Calm"), ("Neutral", "High Energy")),
+    ("dead inside", ("Negative", "Calm"), ("Negative", "Calm")),
+])
+def test_surface_rules_adjust_model_output(stub_model, text, model, expected):
+    stub_model(*model)
+    assert tuple(analyze_text(text).values()) == expected
+    assert analyze_texts([text]) == [Analysis(*expected)]
+
+
+def test_only_spaces_count_as_emoji_separators(stub_model):
+    stub_model("Neutral", "Calm")
+    assert analyze_text("😭 😭")["energy"] == "High Stress"
+    # A newline makes it not emoji-only, matching the original length check
+    assert analyze_text("😭\n😭")["energy"] == "Calm"
+
+
+def test_gibberish_guard_only_matches_letters(stub_model):
+    stub_model("Positive", "Calm")
+    assert analyze_text("asdfghjkl") == {"mood": "Unknown", "energy": "Unknown"}
+    # Numeric-but-not-digit characters are not letters: they reach the model
+    assert analyze_text("½½½½½") == {"mood": "Positive", "energy": "Calm"}
@@ -1,6 +1,105 @@
-from src.storage import create_entry, get_last_entries
+import json
+from concurrent.futures import ProcessPoolExecutor
 
-def test_storage_smoke():
+import pytest
+
+from src import storage
+from src.storage import create_entry, get_last_entries, load_entries
+
+def test_storage_smoke(entries_file):
     entry = create_entry("test entry", {"mood": "Neutral", "energy": "Unknown"})
-    last = get_last_entries(1)[0]
-    assert last.text == "test entry"
+    assert entry.text == "test entry"
+    assert load_entries()[-1].text == entry.text
+
+
+@pytest.fixture
+def entries_file(tmp_path, monkeypatch):
+    """Point storage at an empty data dir under tmp_path."""
+    path = tmp_path / "journal_entries.jsonl"
+    monkeypatch.setattr(storage, "ENTRIES_FILE", path)
+    monkeypatch.setattr(storage, "LEGACY_ENTRIES_FILE", tmp_path / "journal_entries.json")
+    return path
+
+
+def _write_lines(path, items):
+    path.write_text("".join(json.dumps(i) + "\n" for i in items), encoding="utf-8")
+
+
+def test_migrates_legacy_json(entries_file):
+    legacy = [
+        {"id": 1, "timestamp": "2025-01-01T10:00:00", "text": "a", "tags": {}},
+        {"id": 2, "timestamp": "2025-01-02T10:00:00", "text": "b", "tags": {}},
+    ]
+    storage.LEGACY_ENTRIES_FILE.write_text(json.dumps(legacy, indent=2), encoding="utf-8")
+
+    assert [e.text for e in load_entries()] == ["a", "b"]
+    assert entries_file.exists()
+    assert create_entry("c", {}).id == 3
+
+
+def test_migration_sorts_legacy_entries_by_id(entries_file):
+    legacy = [
+        {"id": 7, "timestamp": "2025-01-03T10:00:00", "text": "c", "tags": {}},
+        {"id": 2, "timestamp": "2025-01-01T10:00:00", "text": "a", "tags": {}},
+        {"id": 5, "timestamp": "2025-01-02T10:00:00", "text": "b", "tags": {}},
+    ]
+    storage.LEGACY_ENTRIES_FILE.write_text(json.dumps(legacy), encoding="utf-8")
+
+    assert create_entry("d", {}).id == 8
+    assert [e.id for e in load_entries()] == [2, 5, 7, 8]
+
+
+def test_ids_continue_after_existing_max(entries_file):
+    _write_lines(entries_file, [
+        {"id": 41, "timestamp": "2025-01-01T10:00:00", "text": "a", "tags": {}},
+        {"id": 42, "timestamp": "2025-01-02T10:00:00", "text": "b", "tags": {}},
+    ])
+
+    assert create_entry("c", {}).id == 43
+    assert create_entry("d", {}).id == 44
+    assert [e.id for e in load_entries()] == [41, 42, 43, 44]
+
+
+def test_first_entry_gets_id_1(entries_file):
+    assert create_entry("first", {}).id == 1
+
+
+def test_get_last_entries_order_and_bounds(entries_file):
+    for text in ["a", "b", "c", "d"]:
+        create_entry(text, {})
+
+    assert [e.text for e in get_last_entries(3)] == ["d", "c", "b"]
+    assert [e.text for e in get_last_entries(10)] == ["d", "c", "b", "a"]
+    assert get_last_entries(0) == []
+    assert get_last_entries(-1) == []
+
+
+def test_skips_corrupted_lines(entries_file):
+    entries_file.write_text(
+        json.dumps({"id": 1, "timestamp": "2025-01-01T10:00:00", "text": "a", "tags": {}}) + "\n"
+        + "{not json\n"
+        + json.dumps({"id": 2, "timestamp": "2025-01-02T10:00:00", "text": "b", "tags": {}}) + "\n"
+        + "5\n"  # valid JSON, but not an entry object
+        + '{"id": 3, "text": "trunc',  # partial write, no newline
+        encoding="utf-8",
+    )
+
+    assert [e.id for e in load_entries()] == [1, 2]
+    assert [e.id for e in get_last_entries(2)] == [2, 1]
+    assert create_entry("c", {}).id == 3
+    assert [e.id for e in load_entries()] == [1, 2, 3]
+
+
+def _create_in_subprocess(path, count):
+    storage.ENTRIES_FILE = path
+    storage.LEGACY_ENTRIES_FILE = path.with_suffix(".json")
+    return [create_entry(f"entry {i}", {}).id for i in range(count)]
+
+
+def test_ids_unique_across_processes(entries_file):
+    with ProcessPoolExecutor(max_workers=4) as ex:
+        results = list(ex.map(_create_in_subprocess, [entries_file] * 4, [25] * 4))
+
+    ids = [e.id for e in load_entries()]
+    assert sorted(ids) == list(range(1, 101))
+    assert sorted(i for r in results for i in r) == ids